@@ -1,10 +1,11 @@
 import os
+import json
 import hashlib
 import random
 from datetime import date, datetime
 from zoneinfo import ZoneInfo
 import pandas as pd
-from flask import Flask, jsonify, request, session, render_template
+from flask import Flask, jsonify, request, session, render_template, url_for
 #Above lines import py classes needed. os for file paths and flask for hosting webapp
 
 #Creates instance of flask webapp
@@ -220,6 +221,29 @@ def pick_player(tier, game_date, seed_override=None):
         return random.choice(TIER_POOLS[tier])
     return get_daily_player(tier, game_date, seed_override=seed_override)
 
+#Client-side autocomplete: instead of one /suggest_players POST per keystroke, the page
+#downloads a compact list of every eligible name for the round's position once and filters
+#locally. Each bundle's URL carries a hash of its bytes, so browsers can cache it forever and
+#a data refresh naturally busts the cache. Flip to False to fall back to server-side suggestions.
+CLIENT_SUGGEST = True
+SUGGEST_CACHE_SECONDS = 365 * 24 * 60 * 60
+
+def build_suggest_bundles(df):
+    bundles = {}
+    for position, group in df.groupby('FantPos'):
+        body = json.dumps(group['Player'].unique().tolist(), separators=(',', ':')).encode()
+        bundles[position] = {'version': hashlib.md5(body).hexdigest()[:12], 'body': body}
+    return bundles
+
+SUGGEST_BUNDLES = build_suggest_bundles(eligible_players_prefiltered)
+
+#Versioned URL for a position's name bundle, or None when client-side suggestions are off
+def suggest_bundle_url(position):
+    bundle = SUGGEST_BUNDLES.get(position)
+    if not CLIENT_SUGGEST or bundle is None:
+        return None
+    return url_for('suggest_bundle', position=position, version=bundle['version'])
+
 #If a player has played for different teams for same amount of seasons, tiebreaker goes to recent.
 #This function is called within the game routes
 def get_most_frequent_with_tiebreaker(df, column):
@@ -295,6 +319,7 @@ def begin_round(player_name, tier):
         'difficulty': info['difficulty'],
         'rookie_year': info['rookie_year'],
         'guesses_left': 4,
+        'suggest_bundle': suggest_bundle_url(info['position']),
         'resumed': False,
     }
 
@@ -311,6 +336,7 @@ def resume_round():
         'difficulty': info['difficulty'],
         'rookie_year': info['rookie_year'],
         'guesses_left': session.get('guesses_remaining', 4),
+        'suggest_bundle': suggest_bundle_url(info['position']),
         'resumed': True,
     }
 
@@ -410,6 +436,17 @@ def suggest_players():
     unique_players = filtered_df['Player'].unique().tolist()
     return jsonify(unique_players[:10])
 
+#Serves a position's eligible names for client-side autocomplete. A stale version (the data
+#changed since the page loaded) 404s so the page falls back to /suggest_players.
+@app.route('/suggest_bundle/<position>/<version>.json', methods=['GET'])
+def suggest_bundle(position, version):
+    bundle = SUGGEST_BUNDLES.get(position)
+    if bundle is None or bundle['version'] != version:
+        return jsonify({'error': 'unknown bundle'}), 404
+    response = app.response_class(bundle['body'], mimetype='application/json')
+    response.headers['Cache-Control'] = f'public, max-age={SUGGEST_CACHE_SECONDS}, immutable'
+    return response
+
 @app.route('/guess', methods=['POST'])
 def handle_guess():
     guess = request.get_json().get('guess', '').strip().lower()
@@ -0,0 +1,169 @@
+import argparse
+import random
+
+from app import app, ROUND_TIERS
+
+# Replays full games through Flask's test client and counts how many autocomplete requests
+# the page would make per round. Each round the answer is typed on a simulated keystroke
+# timeline, mirroring templates/game.html:
+#   - handleGuessInput is debounced, so a query only fires once the user pauses DEBOUNCE_MS
+#     (or stops typing), and only for 2+ characters
+#   - the user stops typing as soon as the answer shows up in the suggestions and picks it
+#   server mode: every fired query POSTs to /suggest_players
+#   bundle mode: one GET per uncached position bundle; queries that fire before it arrives
+#                still fall back to /suggest_players, the rest are filtered locally
+# Bundle mode is reported twice: cold (a new visitor, fresh browser cache every game) and
+# warm (one returning browser whose cache persists across every simulated game).
+DEBOUNCE_MS = 300
+MAX_SUGGESTIONS = 10
+
+#Every prefix the input holds while typing the full name, with the time it was typed
+def type_answer(name, args, rng):
+    timeline = []
+    now = args.think_ms
+    for i in range(1, len(name) + 1):
+        timeline.append((name[:i], now))
+        now += max(30, rng.gauss(args.keystroke_ms, args.jitter_ms))
+    return timeline
+
+#The (query, time) pairs handleGuessInput actually sends once debounce(…, 300) settles
+def fired_queries(timeline):
+    fired = []
+    for i, (prefix, typed_at) in enumerate(timeline):
+        is_last = i == len(timeline) - 1
+        if is_last or timeline[i + 1][1] - typed_at >= DEBOUNCE_MS:
+            query = prefix.strip()
+            if len(query) >= 2:
+                fired.append((query, typed_at + DEBOUNCE_MS))
+    return fired
+
+def server_suggestions(client, query):
+    return client.post('/suggest_players', json={'query': query}).get_json()
+
+#Same matching as filterSuggestNames in game.html: case-insensitive substring, first 10 in bundle order
+def local_suggestions(names, query):
+    needle = query.lower()
+    return [name for name in names if needle in name.lower()][:MAX_SUGGESTIONS]
+
+def run_server_mode(client, answer, fired):
+    requests_made = 0
+    for query, _ in fired:
+        requests_made += 1
+        if answer in server_suggestions(client, query):
+            break
+    return requests_made
+
+def run_bundle_mode(client, answer, fired, bundle_url, browser_cache, args):
+    bundle_requests, fallback_requests, bytes_downloaded = 0, 0, 0
+    bundle_ready_at = 0
+    if bundle_url not in browser_cache:
+        response = client.get(bundle_url)
+        bundle_requests += 1
+        bytes_downloaded += len(response.get_data())
+        browser_cache[bundle_url] = response.get_json()
+        bundle_ready_at = args.bundle_ms
+    for query, fired_at in fired:
+        if fired_at < bundle_ready_at:
+            fallback_requests += 1
+            suggestions = server_suggestions(client, query)
+        else:
+            suggestions = local_suggestions(browser_cache[bundle_url], query)
+        if answer in suggestions:
+            break
+    return bundle_requests, fallback_requests, bytes_downloaded
+
+#Compares the bundle's local filter against /suggest_players for every prefix of the answer.
+#The server runs the query through str.contains as a regex, so '.' matches any character
+#there but only a literal '.' locally; those queries are tallied apart from real mismatches.
+def check_parity(client, answer, names, parity):
+    for i in range(2, len(answer) + 1):
+        query = answer[:i].strip()
+        if len(query) < 2:
+            continue
+        matches = server_suggestions(client, query) == local_suggestions(names, query)
+        if matches:
+            parity['match'] += 1
+        elif '.' in query:
+            parity['regex_dot'].append(query)
+        else:
+            parity['mismatch'].append(query)
+
+#Clears the test client's session so each simulated game starts at round 1, even with the
+#daily lock on (RANDOM_MODE = False would otherwise refuse a second game with daily_complete)
+def start_new_game(client):
+    with client.session_transaction() as sess:
+        sess.clear()
+
+def main(args):
+    rng = random.Random(args.seed)
+    client = app.test_client()
+    warm_cache = {}
+    totals = {
+        'raw': {'requests': 0},
+        'server': {'requests': 0},
+        'bundle (cold)': {'requests': 0, 'fallback': 0, 'bytes': 0},
+        'bundle (warm)': {'requests': 0, 'fallback': 0, 'bytes': 0},
+    }
+    parity = {'match': 0, 'regex_dot': [], 'mismatch': []}
+    rounds_played = 0
+
+    for _ in range(args.games):
+        start_new_game(client)
+        cold_cache = {}
+        for _ in ROUND_TIERS:
+            round_data = client.post('/start_game', json={}).get_json()
+            if round_data.get('error'):
+                print(f"Error: /start_game returned '{round_data['error']}' mid-game.")
+                return
+            if not round_data.get('suggest_bundle'):
+                print("Error: round has no suggest bundle. Turn CLIENT_SUGGEST on in app.py.")
+                return
+            with client.session_transaction() as sess:
+                answer = sess['correct_player_display']
+            bundle_url = round_data['suggest_bundle']
+            timeline = type_answer(answer, args, rng)
+            fired = fired_queries(timeline)
+
+            totals['raw']['requests'] += sum(1 for prefix, _ in timeline if len(prefix.strip()) >= 2)
+            totals['server']['requests'] += run_server_mode(client, answer, fired)
+            for mode, cache in [('bundle (cold)', cold_cache), ('bundle (warm)', warm_cache)]:
+                bundle_requests, fallback_requests, bytes_downloaded = run_bundle_mode(client, answer, fired, bundle_url, cache, args)
+                totals[mode]['requests'] += bundle_requests + fallback_requests
+                totals[mode]['fallback'] += fallback_requests
+                totals[mode]['bytes'] += bytes_downloaded
+            check_parity(client, answer, warm_cache[bundle_url], parity)
+
+            client.post('/give_up')
+            rounds_played += 1
+
+    print(f"\n--- Autocomplete requests over {args.games} games ({rounds_played} rounds) ---")
+    print(f"Typing {args.keystroke_ms}±{args.jitter_ms} ms/key after {args.think_ms} ms, bundle arrives after {args.bundle_ms} ms, debounce {DEBOUNCE_MS} ms")
+    labels = {
+        'raw': 'server, no debounce (upper bound)',
+        'server': 'server, debounced',
+        'bundle (cold)': 'bundle, cold cache',
+        'bundle (warm)': 'bundle, warm cache',
+    }
+    for mode, stats in totals.items():
+        per_round = stats['requests'] / rounds_played
+        line = f"{labels[mode]:>34}: {stats['requests']:>6} requests ({per_round:.2f}/round)"
+        if 'bytes' in stats:
+            line += f", {stats['fallback']} fallback POSTs, {stats['bytes']} bundle bytes"
+        print(line)
+
+    checked = parity['match'] + len(parity['regex_dot']) + len(parity['mismatch'])
+    print(f"\nParity: {parity['match']}/{checked} prefixes give the same top {MAX_SUGGESTIONS} locally as /suggest_players")
+    if parity['regex_dot']:
+        print(f"  {len(parity['regex_dot'])} differ only because the server treats '.' as a regex wildcard, e.g. {parity['regex_dot'][:3]}")
+    assert not parity['mismatch'], f"Local filter disagrees with /suggest_players for {parity['mismatch'][:10]}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare server-side vs client-side autocomplete request volume.")
+    parser.add_argument("-g", "--games", type=int, default=100, help="Number of full daily games to simulate.")
+    parser.add_argument("--keystroke-ms", type=float, default=200, help="Mean gap between keystrokes.")
+    parser.add_argument("--jitter-ms", type=float, default=100, help="Standard deviation of the keystroke gap.")
+    parser.add_argument("--think-ms", type=float, default=2000, help="Time from round start to the first keystroke.")
+    parser.add_argument("--bundle-ms", type=float, default=150, help="Time for an uncached bundle download to arrive.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the keystroke timing.")
+    args = parser.parse_args()
+    main(args)